@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures for the session scheduler tests
+
+Session-scoped fixtures are built once per run, or once per worker when
+the suite is distributed with pytest-xdist (``pytest -n auto``).
+"""
+
+import pytest
+from scheduler import (
+    ConflictIndex, SessionScheduler, BacktrackingScheduler, BranchAndBoundScheduler, ILPScheduler
+)
+from mock_data import MockDataGenerator
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-compare-cache", action="store_true", default=False,
+        help="rerun every scheduler comparison instead of reusing earlier results",
+    )
+
+
+@pytest.fixture
+def verbose(request):
+    """True under -v; the comparison tests only format their reports then"""
+    return request.config.getoption("verbose") > 0
+
+
+# Scenarios are deterministic and never mutated, so build each once per run
+@pytest.fixture(scope="session")
+def simple_scenario():
+    return MockDataGenerator.create_simple_scenario()
+
+
+@pytest.fixture(scope="session")
+def aws_reinvent_scenario():
+    return MockDataGenerator.create_aws_reinvent_scenario()
+
+
+@pytest.fixture(scope="session")
+def complex_scenario():
+    return MockDataGenerator.create_complex_scenario()
+
+
+@pytest.fixture(scope="session")
+def aws_conflict_index(aws_reinvent_scenario):
+    """Slot conflict masks for the AWS scenario, shared by every scheduler"""
+    session_requests, travel_times = aws_reinvent_scenario
+    return ConflictIndex.build([req.session for req in session_requests], travel_times)
+
+
+def _solve(scheduler_cls, scenario, conflict_index=None):
+    """Run one scheduler on a scenario and return (scheduler, schedule, stats)"""
+    sessions, travel_times = scenario
+    scheduler = scheduler_cls(sessions, travel_times, conflict_index)
+    schedule = scheduler.optimize_schedule()
+    return scheduler, schedule, scheduler.get_statistics(schedule)
+
+
+# Solver results are deterministic; tests only read the shared schedules
+@pytest.fixture(scope="session")
+def solved_greedy_aws(aws_reinvent_scenario, aws_conflict_index):
+    return _solve(SessionScheduler, aws_reinvent_scenario, aws_conflict_index)
+
+
+@pytest.fixture(scope="session")
+def solved_greedy_complex(complex_scenario):
+    return _solve(SessionScheduler, complex_scenario)
+
+
+@pytest.fixture(scope="session")
+def solved_backtracking_aws(aws_reinvent_scenario, aws_conflict_index):
+    return _solve(BacktrackingScheduler, aws_reinvent_scenario, aws_conflict_index)
+
+
+@pytest.fixture(scope="session")
+def solved_bnb_aws(aws_reinvent_scenario, aws_conflict_index):
+    return _solve(BranchAndBoundScheduler, aws_reinvent_scenario, aws_conflict_index)
+
+
+@pytest.fixture(scope="session")
+def solved_ilp_aws(aws_reinvent_scenario, aws_conflict_index):
+    pytest.importorskip("pulp")
+    return _solve(ILPScheduler, aws_reinvent_scenario, aws_conflict_index)
+
+
+@pytest.fixture(scope="session")
+def solved_ilp_simple(simple_scenario):
+    pytest.importorskip("pulp")
+    return _solve(ILPScheduler, simple_scenario)
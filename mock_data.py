@@ -2,13 +2,19 @@
 Mock data generator for testing the session scheduler
 """
 
+import functools
 from datetime import datetime, timedelta
 from scheduler import Location, TimeSlot, Session, SessionRequest, Priority, TravelMode
 from typing import List, Dict
 
 
 class MockDataGenerator:
-    """Generates realistic mock data for event scheduling"""
+    """
+    Generates realistic mock data for event scheduling.
+
+    Scenario factories are memoized, so every caller shares one copy of each
+    scenario and must treat it as read-only.
+    """
     
     @staticmethod
     def create_locations() -> List[Location]:
@@ -52,6 +58,7 @@ class MockDataGenerator:
         return travel_times
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_simple_scenario() -> tuple:
         """
         Create a simple test scenario with clear conflicts.
@@ -100,6 +107,7 @@ class MockDataGenerator:
         return session_requests, travel_times
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_aws_reinvent_scenario() -> tuple:
         """
         Create a realistic AWS re:Invent-style scenario.
@@ -197,6 +205,7 @@ class MockDataGenerator:
         return session_requests, travel_times
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_complex_scenario() -> tuple:
         """
         Create a complex scenario with many conflicts and constraints.
@@ -251,6 +260,7 @@ class MockDataGenerator:
         return session_requests, travel_times
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_heavy_conflict_scenario() -> tuple:
         """
         Create a scenario with heavy conflicts but multiple time slot options.
@@ -361,6 +371,7 @@ class MockDataGenerator:
         return session_requests, travel_times
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_travel_intensive_scenario() -> tuple:
         """
         Create a scenario where travel time is critical.
@@ -460,6 +471,7 @@ class MockDataGenerator:
         return session_requests, travel_times
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_sparse_options_scenario() -> tuple:
         """
         Create a scenario with very limited time slot options.
@@ -560,6 +572,7 @@ class MockDataGenerator:
         return session_requests, travel_times
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_large_scale_scenario() -> tuple:
         """
         Create a large-scale scenario to test performance.
@@ -660,6 +673,7 @@ class MockDataGenerator:
         return session_requests, travel_times
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_multiple_optimal_solutions_scenario() -> tuple:
         """
         Create a scenario with multiple equally-optimal solutions.
@@ -3,6 +3,8 @@ Event Session Scheduler
 Optimizes session attendance at large events with time/location conflicts
 """
 
+import heapq
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Set, Optional
@@ -89,15 +91,216 @@ class ScheduleEntry:
     time_slot: TimeSlot
 
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(moment: datetime) -> int:
+    """Integer microseconds since 1970-01-01; aware datetimes are taken as UTC"""
+    offset = moment.utcoffset()
+    if offset is not None:
+        moment = (moment - offset).replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _canonical_travel_times(travel_times: Dict[tuple, int]) -> Dict[tuple, int]:
+    """Store each location pair once, under its (smaller_id, larger_id) key"""
+    canonical = {}
+    for (loc1_id, loc2_id), minutes in travel_times.items():
+        key = (loc1_id, loc2_id) if loc1_id < loc2_id else (loc2_id, loc1_id)
+        # Keep the first value seen when both directions are given
+        canonical.setdefault(key, minutes)
+    return canonical
+
+
+@dataclass
+class ConflictIndex:
+    """
+    Flat numbering of every candidate time slot with pairwise conflict bitmasks.
+
+    Slot ids are assigned in session order and every per-slot attribute is
+    stored as a parallel list indexed by slot id, so the search loops work on
+    plain integers. Bit ``h`` of ``conflict_masks[g]`` is set when slots ``g``
+    and ``h`` belong to different sessions and cannot both be attended;
+    ``conflict_lists[g]`` holds the same slot ids as a sorted list.
+
+    ``candidate_slots`` keeps one representative per session for slots with
+    identical conflict masks: such slots are interchangeable, so the searches
+    only need to branch on one of them.
+    """
+    sessions: List[Session] = field(default_factory=list)
+    slots: List[TimeSlot] = field(default_factory=list)
+    slot_session: List[int] = field(default_factory=list)
+    slot_loc: List[int] = field(default_factory=list)
+    slot_ids: Dict[str, List[int]] = field(default_factory=dict)
+    location_index: Dict[str, int] = field(default_factory=dict)
+    travel_matrix: List[List[int]] = field(default_factory=list)
+    conflict_masks: List[int] = field(default_factory=list)
+    conflict_lists: List[List[int]] = field(default_factory=list)
+    candidate_slots: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, sessions: List[Session], travel_times: Dict[tuple, int]) -> 'ConflictIndex':
+        """
+        Number all time slots and precompute which pairs conflict.
+
+        Args:
+            sessions: Sessions whose time slots should be indexed
+            travel_times: Dict mapping (location_id1, location_id2) -> minutes;
+                travel is symmetric, and the first value seen wins when both
+                directions are given
+        """
+        index = cls(sessions=list(sessions))
+        slot_session = index.slot_session
+        slot_loc = index.slot_loc
+        location_index = index.location_index
+        for session_idx, session in enumerate(sessions):
+            index.slot_ids[session.id] = list(range(len(index.slots), len(index.slots) + len(session.time_slots)))
+            index.slots.extend(session.time_slots)
+            slot_session.extend([session_idx] * len(session.time_slots))
+            for time_slot in session.time_slots:
+                slot_loc.append(location_index.setdefault(time_slot.location.id, len(location_index)))
+
+        # Dense, symmetric travel matrix by location index. Pairs go through the
+        # same canonical form as the schedulers' dicts, so when both directions
+        # are given the first value seen wins regardless of slot order
+        matrix = [[0] * len(location_index) for _ in location_index]
+        for (loc1_id, loc2_id), minutes in _canonical_travel_times(travel_times).items():
+            if loc1_id in location_index and loc2_id in location_index and loc1_id != loc2_id:
+                i, j = location_index[loc1_id], location_index[loc2_id]
+                matrix[i][j] = matrix[j][i] = minutes
+        index.travel_matrix = matrix
+
+        # Sweep the slots by start time on integer microseconds. A slot whose
+        # end plus the longest travel time is not after the current start can
+        # no longer conflict with it or any later slot, so only the heap of
+        # still-active slots is compared: O(S log S + K) for K active pairs.
+        # The test matches TimeSlot.conflicts_with.
+        starts = [_to_micros(slot.start_time) for slot in index.slots]
+        ends = [_to_micros(slot.end_time) for slot in index.slots]
+        buffers = [[minutes * 60_000_000 for minutes in row] for row in matrix]
+        max_buffer = max((minutes for row in buffers for minutes in row), default=0)
+
+        masks = [0] * len(index.slots)
+        lists = [[] for _ in index.slots]
+        active = []
+        for g in sorted(range(len(index.slots)), key=starts.__getitem__):
+            start, end = starts[g], ends[g]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            buffer_row = buffers[slot_loc[g]]
+            session_idx = slot_session[g]
+            for _, h in active:
+                if slot_session[h] == session_idx:
+                    continue
+                buffer = buffer_row[slot_loc[h]]
+                if starts[h] < end + buffer and start < ends[h] + buffer:
+                    masks[g] |= 1 << h
+                    masks[h] |= 1 << g
+                    lists[g].append(h)
+                    lists[h].append(g)
+            heapq.heappush(active, (end + max_buffer, g))
+        for conflicting in lists:
+            conflicting.sort()
+        index.conflict_masks = masks
+        index.conflict_lists = lists
+
+        # Symmetry breaking: first slot of each distinct mask within a session
+        for session in sessions:
+            representatives = {}
+            for slot_id in index.slot_ids[session.id]:
+                representatives.setdefault(masks[slot_id], slot_id)
+            index.candidate_slots[session.id] = list(representatives.values())
+        return index
+
+    def session_components(self) -> List[List[int]]:
+        """
+        Split sessions into connected components of the session conflict graph.
+        Sessions in different components have no conflicting slots, so each
+        component can be scheduled independently.
+
+        Returns:
+            Sorted lists of session indices, one per component
+        """
+        seen = [False] * len(self.sessions)
+        components = []
+        for start in range(len(self.sessions)):
+            if seen[start]:
+                continue
+            seen[start] = True
+            component = [start]
+            # Breadth-first search; ``component`` doubles as the queue
+            for session_idx in component:
+                for slot_id in self.slot_ids[self.sessions[session_idx].id]:
+                    for other in self.conflict_lists[slot_id]:
+                        other_idx = self.slot_session[other]
+                        if not seen[other_idx]:
+                            seen[other_idx] = True
+                            component.append(other_idx)
+            components.append(sorted(component))
+        return components
+
+    def to_schedule(self, slot_ids: List[int]) -> 'Schedule':
+        """Materialize a list of chosen slot ids as a Schedule"""
+        schedule = Schedule(conflict_masks=self.conflict_masks)
+        for slot_id in slot_ids:
+            schedule.add_entry(self.sessions[self.slot_session[slot_id]], self.slots[slot_id], slot_id)
+        return schedule
+
+
 @dataclass
 class Schedule:
-    """A complete schedule of sessions"""
+    """
+    A complete schedule of sessions.
+
+    Entries added with their ``ConflictIndex`` slot id also update an occupied
+    bitmask, so ``has_conflict`` can answer with a single AND against
+    ``conflict_masks`` instead of rescanning every entry. Any entry without a
+    slot id (including those passed in as ``entries``) switches
+    ``has_conflict`` back to the scan until it is removed.
+
+    After construction, ``entries`` must only change through ``add_entry`` and
+    ``pop_entry``; editing the list directly leaves ``is_scheduled`` and the
+    bitmask stale.
+    """
     entries: List[ScheduleEntry] = field(default_factory=list)
-    
-    def add_entry(self, session: Session, time_slot: TimeSlot) -> None:
-        """Add a session with its selected time slot"""
+    conflict_masks: Optional[List[int]] = field(default=None, repr=False, compare=False)
+    _scheduled_ids: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _slot_ids: List[Optional[int]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _occupied_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _untracked: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Initial entries carry no slot ids
+        self._scheduled_ids = {entry.session.id for entry in self.entries}
+        self._slot_ids = [None] * len(self.entries)
+        self._untracked = len(self.entries)
+
+    def add_entry(self, session: Session, time_slot: TimeSlot, slot_id: Optional[int] = None) -> None:
+        """Add a session with its selected time slot (and optional global slot id)"""
         self.entries.append(ScheduleEntry(session, time_slot))
-    
+        self._scheduled_ids.add(session.id)
+        self._slot_ids.append(slot_id)
+        if slot_id is None:
+            self._untracked += 1
+        else:
+            self._occupied_mask |= 1 << slot_id
+
+    def pop_entry(self) -> ScheduleEntry:
+        """Remove and return the most recently added entry"""
+        entry = self.entries.pop()
+        self._scheduled_ids.discard(entry.session.id)
+        slot_id = self._slot_ids.pop()
+        if slot_id is None:
+            self._untracked -= 1
+        else:
+            self._occupied_mask &= ~(1 << slot_id)
+        return entry
+
+    def is_scheduled(self, session: Session) -> bool:
+        """Check if a session already has a time slot in this schedule"""
+        return session.id in self._scheduled_ids
+
     def get_scheduled_sessions(self) -> Set[Session]:
         """Get all sessions in this schedule"""
         return {entry.session for entry in self.entries}
@@ -106,8 +309,23 @@ class Schedule:
         """Get all scheduled time slots"""
         return [entry.time_slot for entry in self.entries]
     
-    def has_conflict(self, time_slot: TimeSlot, travel_times: Dict) -> bool:
-        """Check if adding this time slot would create a conflict"""
+    def has_conflict(self, time_slot: TimeSlot, travel_times: Dict, slot_id: Optional[int] = None) -> bool:
+        """
+        Check if adding this time slot would create a conflict.
+
+        When ``slot_id`` is given, the schedule was created with
+        ``conflict_masks`` and every entry carries its slot id, the check is a
+        bitmask test; otherwise every entry is scanned.
+
+        ``travel_times`` must already be in the canonical form built by
+        ``_canonical_travel_times``, as the schedulers pass it. A raw dict
+        with both directions of a pair is read at its (smaller_id, larger_id)
+        key in the scan, which need not be the first-seen value that
+        ``ConflictIndex`` keeps.
+        """
+        if slot_id is not None and self.conflict_masks is not None and not self._untracked:
+            return bool(self.conflict_masks[slot_id] & self._occupied_mask)
+
         for entry in self.entries:
             travel_time = self._get_travel_time(entry.time_slot.location, time_slot.location, travel_times)
             if entry.time_slot.conflicts_with(time_slot, travel_time):
@@ -118,9 +336,13 @@ class Schedule:
         """Get travel time between two locations"""
         if loc1 == loc2:
             return 0
-        key = (loc1.id, loc2.id)
-        reverse_key = (loc2.id, loc1.id)
-        return travel_times.get(key, travel_times.get(reverse_key, 0))
+        # Canonical (smaller_id, larger_id) key first; the schedulers store only
+        # that form. The reverse lookup only serves raw one-direction dicts
+        key = (loc1.id, loc2.id) if loc1.id < loc2.id else (loc2.id, loc1.id)
+        minutes = travel_times.get(key)
+        if minutes is None:
+            minutes = travel_times.get((key[1], key[0]), 0)
+        return minutes
     
     def count_by_priority(self, session_priorities: Dict[str, Priority]) -> Dict[Priority, int]:
         """
@@ -142,16 +364,20 @@ class SessionScheduler:
     Priority: Maximize must-attend sessions first, then optional sessions.
     """
 
-    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int]):
+    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int],
+                 conflict_index: Optional[ConflictIndex] = None):
         """
         Initialize scheduler.
 
         Args:
             session_requests: List of session requests (session + priority)
             travel_times: Dict mapping (location_id1, location_id2) -> minutes
+            conflict_index: Prebuilt ConflictIndex for the same sessions and
+                travel times (e.g. shared between schedulers); when omitted,
+                conflicts are checked by scanning the scheduled entries
         """
         self.session_requests = session_requests
-        self.travel_times = travel_times
+        self.travel_times = _canonical_travel_times(travel_times)
 
         # Create priority mapping from session ID to priority
         self.session_priorities = {req.session.id: req.priority for req in session_requests}
@@ -159,6 +385,10 @@ class SessionScheduler:
         # Separate by priority
         self.must_attend = [req.session for req in session_requests if req.priority == Priority.MUST_ATTEND]
         self.optional = [req.session for req in session_requests if req.priority == Priority.OPTIONAL]
+
+        # A shared index turns each candidate check into a bitmask test; building
+        # one here would cost more than the O(n * m * k) greedy pass itself
+        self.conflict_index = conflict_index
     
     def optimize_schedule(self) -> Schedule:
         """
@@ -172,7 +402,8 @@ class SessionScheduler:
         Returns:
             Optimized schedule
         """
-        schedule = Schedule()
+        conflict_masks = self.conflict_index.conflict_masks if self.conflict_index is not None else None
+        schedule = Schedule(conflict_masks=conflict_masks)
         
         # Phase 1: Schedule must-attend sessions
         self._schedule_sessions(self.must_attend, schedule)
@@ -192,13 +423,17 @@ class SessionScheduler:
         
         for session in sorted_sessions:
             # Skip if already scheduled
-            if session in schedule.get_scheduled_sessions():
+            if schedule.is_scheduled(session):
                 continue
             
             # Try each time slot for this session
-            for time_slot in session.time_slots:
-                if not schedule.has_conflict(time_slot, self.travel_times):
-                    schedule.add_entry(session, time_slot)
+            if self.conflict_index is not None:
+                slot_ids = self.conflict_index.slot_ids[session.id]
+            else:
+                slot_ids = [None] * len(session.time_slots)
+            for slot_id, time_slot in zip(slot_ids, session.time_slots):
+                if not schedule.has_conflict(time_slot, self.travel_times, slot_id):
+                    schedule.add_entry(session, time_slot, slot_id)
                     break
     
     def get_statistics(self, schedule: Schedule) -> Dict:
@@ -244,19 +479,22 @@ class BacktrackingScheduler:
     - Prioritizes must-attend sessions first
 
     Time Complexity: O(m^n) worst case, where m = avg time slots, n = sessions
-    Space Complexity: O(n) for recursion stack
+    Space Complexity: O(n * m) for the explicit search stack
     """
 
-    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int]):
+    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int],
+                 conflict_index: Optional[ConflictIndex] = None):
         """
         Initialize backtracking scheduler.
 
         Args:
             session_requests: List of session requests (session + priority)
             travel_times: Dict mapping (location_id1, location_id2) -> minutes
+            conflict_index: Prebuilt ConflictIndex for the same sessions and
+                travel times (e.g. shared between schedulers); built if omitted
         """
         self.session_requests = session_requests
-        self.travel_times = travel_times
+        self.travel_times = _canonical_travel_times(travel_times)
 
         # Create priority mapping
         self.session_priorities = {req.session.id: req.priority for req in session_requests}
@@ -267,6 +505,11 @@ class BacktrackingScheduler:
         self.best_schedule = None
         self.nodes_explored = 0
 
+        # Flat slot numbering and conflict masks used by the search
+        if conflict_index is None:
+            conflict_index = ConflictIndex.build([req.session for req in session_requests], self.travel_times)
+        self.conflict_index = conflict_index
+
     def optimize_schedule(self) -> Schedule:
         """
         Find optimal schedule using backtracking.
@@ -283,65 +526,89 @@ class BacktrackingScheduler:
         # Sort by number of time slots (constrained first heuristic)
         ordered_sessions = sorted(ordered_sessions, key=lambda s: len(s.time_slots))
 
-        current_schedule = Schedule()
-        self._backtrack(ordered_sessions, 0, current_schedule)
+        # Sessions in different components never conflict: search each
+        # component on its own and combine the best partial schedules
+        best_ids = []
+        for component in self.conflict_index.session_components():
+            members = {self.conflict_index.sessions[i].id for i in component}
+            self._prepare_search([s for s in ordered_sessions if s.id in members])
+            self._backtrack()
+            best_ids.extend(self._best_ids)
 
+        self.best_schedule = self.conflict_index.to_schedule(best_ids)
         return self.best_schedule
 
-    def _backtrack(self, sessions: List[Session], index: int, current_schedule: Schedule) -> None:
+    def _prepare_search(self, ordered_sessions: List[Session]) -> None:
+        """Set up the per-search arrays for an ordered list of sessions"""
+        # Search over global slot ids; Schedule objects are only built for the result
+        self._candidates = [self.conflict_index.candidate_slots[s.id] for s in ordered_sessions]
+        self._is_must = [1 if self.session_priorities[s.id] == Priority.MUST_ATTEND else 0 for s in ordered_sessions]
+        # _later_slots[i] = bitmask of every candidate slot at positions i and later
+        self._later_slots = [0] * (len(ordered_sessions) + 1)
+        for i in range(len(ordered_sessions) - 1, -1, -1):
+            self._later_slots[i] = self._later_slots[i + 1] | sum(1 << slot_id for slot_id in self._candidates[i])
+        self._best_ids = []
+        self._best_must = 0
+
+    def _backtrack(self) -> None:
         """
-        Recursive backtracking function.
-
-        Args:
-            sessions: Ordered list of sessions to schedule
-            index: Current session index
-            current_schedule: Current partial schedule
-        """
-        self.nodes_explored += 1
-
-        # Base case: processed all sessions
-        if index >= len(sessions):
-            if self._is_better_schedule(current_schedule, self.best_schedule):
-                # Deep copy the schedule
-                self.best_schedule = Schedule()
-                for entry in current_schedule.entries:
-                    self.best_schedule.add_entry(entry.session, entry.time_slot)
-            return
-
-        current_session = sessions[index]
-
-        # Try each time slot for this session
-        for time_slot in current_session.time_slots:
-            if not current_schedule.has_conflict(time_slot, self.travel_times):
-                # Schedule this session
-                current_schedule.add_entry(current_session, time_slot)
-
-                # Recurse to next session
-                self._backtrack(sessions, index + 1, current_schedule)
-
-                # Backtrack: remove this session
-                current_schedule.entries.pop()
-
-        # Also try NOT scheduling this session (might allow more sessions later)
-        self._backtrack(sessions, index + 1, current_schedule)
-
-    def _is_better_schedule(self, schedule1: Schedule, schedule2: Schedule) -> bool:
-        """
-        Compare two schedules to determine which is better.
-        Priority: More must-attend sessions, then more total sessions.
+        Depth-first backtracking over the prepared sessions.
+
+        Uses an explicit stack instead of recursion. Each frame is
+        ``(index, depth, slot_id, blocked, must_count)``: the node at session
+        position ``index`` whose partial schedule is the first ``depth`` chosen
+        slot ids plus ``slot_id`` (-1 when the previous session was skipped).
+        ``blocked`` is the OR of the chosen slots' conflict masks, so a slot
+        fits exactly when its own bit is clear.
         """
-        if schedule2 is None or len(schedule2.entries) == 0:
-            return len(schedule1.entries) > 0
-
-        counts1 = schedule1.count_by_priority(self.session_priorities)
-        counts2 = schedule2.count_by_priority(self.session_priorities)
-
-        # First priority: must-attend sessions
-        if counts1[Priority.MUST_ATTEND] != counts2[Priority.MUST_ATTEND]:
-            return counts1[Priority.MUST_ATTEND] > counts2[Priority.MUST_ATTEND]
+        candidates = self._candidates
+        is_must = self._is_must
+        later_slots = self._later_slots
+        conflict_masks = self.conflict_index.conflict_masks
+        session_count = len(candidates)
+
+        chosen = []
+        stack = [(0, 0, -1, 0, 0)]
+        while stack:
+            index, depth, slot_id, blocked, must_count = stack.pop()
+            # Backtrack: drop choices made below this frame's parent
+            del chosen[depth:]
+            if slot_id >= 0:
+                chosen.append(slot_id)
+            self.nodes_explored += 1
+
+            # Base case: processed all sessions
+            if index >= session_count:
+                # Priority: more must-attend sessions, then more total sessions
+                if (must_count, len(chosen)) > (self._best_must, len(self._best_ids)):
+                    self._best_ids = list(chosen)
+                    self._best_must = must_count
+                continue
 
-        # Second priority: total sessions
-        return len(schedule1.entries) > len(schedule2.entries)
+            # Collect the slots that fit. A feasible slot that conflicts with none
+            # of the remaining sessions' slots dominates every other choice,
+            # including skipping: any completion of another choice stays valid
+            # with that slot instead.
+            remaining = later_slots[index + 1]
+            feasible = []
+            dominant = False
+            for candidate in candidates[index]:
+                if not blocked >> candidate & 1:
+                    mask = conflict_masks[candidate]
+                    if not mask & remaining:
+                        feasible = [candidate]
+                        dominant = True
+                        break
+                    feasible.append(candidate)
+
+            # Push children in reverse so they are visited in order: each slot
+            # first, then NOT scheduling this session (might allow more later)
+            depth = len(chosen)
+            if not dominant:
+                stack.append((index + 1, depth, -1, blocked, must_count))
+            next_must = must_count + is_must[index]
+            for candidate in reversed(feasible):
+                stack.append((index + 1, depth, candidate, blocked | conflict_masks[candidate], next_must))
 
     def get_statistics(self, schedule: Schedule) -> Dict:
         """Get statistics about the schedule"""
@@ -385,21 +652,25 @@ class BranchAndBoundScheduler:
     - Prunes branches that can't possibly beat current best
     - Uses heuristics to estimate maximum achievable sessions
     - Prioritizes must-attend sessions
+    - Warm start: the greedy schedule is the initial best solution
 
     Time Complexity: O(m^n) worst case, but typically much faster due to pruning
-    Space Complexity: O(n) for recursion stack
+    Space Complexity: O(n * m) for the explicit search stack
     """
 
-    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int]):
+    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int],
+                 conflict_index: Optional[ConflictIndex] = None):
         """
         Initialize branch and bound scheduler.
 
         Args:
             session_requests: List of session requests (session + priority)
             travel_times: Dict mapping (location_id1, location_id2) -> minutes
+            conflict_index: Prebuilt ConflictIndex for the same sessions and
+                travel times (e.g. shared between schedulers); built if omitted
         """
         self.session_requests = session_requests
-        self.travel_times = travel_times
+        self.travel_times = _canonical_travel_times(travel_times)
 
         # Create priority mapping
         self.session_priorities = {req.session.id: req.priority for req in session_requests}
@@ -409,12 +680,21 @@ class BranchAndBoundScheduler:
         self.optional = [req.session for req in session_requests if req.priority == Priority.OPTIONAL]
         self.best_schedule = None
         self.nodes_explored = 0
+
+        # Flat slot numbering and conflict masks used by the search
+        if conflict_index is None:
+            conflict_index = ConflictIndex.build([req.session for req in session_requests], self.travel_times)
+        self.conflict_index = conflict_index
         self.branches_pruned = 0
 
-    def optimize_schedule(self) -> Schedule:
+    def optimize_schedule(self, incumbent: Optional[Schedule] = None) -> Schedule:
         """
         Find optimal schedule using branch and bound.
 
+        Args:
+            incumbent: Conflict-free schedule for the same sessions used as the
+                starting best solution; the greedy schedule if omitted
+
         Returns:
             Best schedule found
         """
@@ -422,111 +702,138 @@ class BranchAndBoundScheduler:
         self.nodes_explored = 0
         self.branches_pruned = 0
 
+        # Warm start: the search only has to beat the incumbent, so the bound
+        # starts pruning from the first node instead of after the first leaf
+        if incumbent is None:
+            incumbent = SessionScheduler(self.session_requests, self.travel_times, self.conflict_index).optimize_schedule()
+        incumbent_ids = {
+            entry.session.id: self.conflict_index.slot_ids[entry.session.id][entry.session.time_slots.index(entry.time_slot)]
+            for entry in incumbent.entries
+        }
+
         # Prioritize must-attend, then optional
         ordered_sessions = self.must_attend + self.optional
 
         # Sort by number of time slots (constrained first heuristic)
         ordered_sessions = sorted(ordered_sessions, key=lambda s: len(s.time_slots))
 
-        current_schedule = Schedule()
-        self._branch_and_bound(ordered_sessions, 0, current_schedule)
-
+        # Sessions in different components never conflict: search each
+        # component on its own and combine the best partial schedules
+        best_ids = []
+        for component in self.conflict_index.session_components():
+            members = {self.conflict_index.sessions[i].id for i in component}
+            self._prepare_search([s for s in ordered_sessions if s.id in members])
+            seeded = [session_id for session_id in incumbent_ids if session_id in members]
+            self._best_ids = [incumbent_ids[session_id] for session_id in seeded]
+            self._best_must = sum(self.session_priorities[session_id] == Priority.MUST_ATTEND for session_id in seeded)
+            self._branch_and_bound()
+            best_ids.extend(self._best_ids)
+
+        self.best_schedule = self.conflict_index.to_schedule(best_ids)
         return self.best_schedule
 
-    def _branch_and_bound(self, sessions: List[Session], index: int, current_schedule: Schedule) -> None:
+    def _prepare_search(self, ordered_sessions: List[Session]) -> None:
+        """Set up the per-search arrays and bounds for an ordered list of sessions"""
+        # Search over global slot ids; Schedule objects are only built for the result
+        self._candidates = [self.conflict_index.candidate_slots[s.id] for s in ordered_sessions]
+        self._is_must = [1 if self.session_priorities[s.id] == Priority.MUST_ATTEND else 0 for s in ordered_sessions]
+        # _later_slots[i] = bitmask of every candidate slot at positions i and later
+        self._later_slots = [0] * (len(ordered_sessions) + 1)
+        for i in range(len(ordered_sessions) - 1, -1, -1):
+            self._later_slots[i] = self._later_slots[i + 1] | sum(1 << slot_id for slot_id in self._candidates[i])
+        # _remaining_must[i] = must-attend sessions at positions i and later
+        self._remaining_must = [0] * (len(ordered_sessions) + 1)
+        for i in range(len(ordered_sessions) - 1, -1, -1):
+            self._remaining_must[i] = self._remaining_must[i + 1] + self._is_must[i]
+        self._best_ids = []
+        self._best_must = 0
+
+    def _branch_and_bound(self) -> None:
         """
-        Recursive branch and bound function.
-
-        Args:
-            sessions: Ordered list of sessions to schedule
-            index: Current session index
-            current_schedule: Current partial schedule
+        Depth-first branch and bound over the prepared sessions.
+
+        Uses an explicit stack instead of recursion. Each frame is
+        ``(index, depth, slot_id, blocked, must_count)``: the node at session
+        position ``index`` whose partial schedule is the first ``depth`` chosen
+        slot ids plus ``slot_id`` (-1 when the previous session was skipped).
+        ``blocked`` is the OR of the chosen slots' conflict masks, so a slot
+        fits exactly when its own bit is clear.
+
+        The optimistic bound assumes every remaining session still fits, i.e.
+        ``(must_count + remaining must-attend, scheduled + remaining sessions)``;
+        a branch is pruned once that can no longer beat the best schedule.
+        Search state and counters are kept in locals and stored at the end.
         """
-        self.nodes_explored += 1
-
-        # Base case: processed all sessions
-        if index >= len(sessions):
-            if self._is_better_schedule(current_schedule, self.best_schedule):
-                # Deep copy the schedule
-                self.best_schedule = Schedule()
-                for entry in current_schedule.entries:
-                    self.best_schedule.add_entry(entry.session, entry.time_slot)
-            return
-
-        # Pruning: check if this branch can possibly improve best solution
-        upper_bound = self._calculate_upper_bound(sessions, index, current_schedule)
-        if not self._can_improve_best(upper_bound):
-            self.branches_pruned += 1
-            return
-
-        current_session = sessions[index]
-
-        # Try each time slot for this session
-        for time_slot in current_session.time_slots:
-            if not current_schedule.has_conflict(time_slot, self.travel_times):
-                # Schedule this session
-                current_schedule.add_entry(current_session, time_slot)
-
-                # Recurse to next session
-                self._branch_and_bound(sessions, index + 1, current_schedule)
-
-                # Backtrack: remove this session
-                current_schedule.entries.pop()
-
-        # Also try NOT scheduling this session
-        self._branch_and_bound(sessions, index + 1, current_schedule)
-
-    def _calculate_upper_bound(self, sessions: List[Session], start_index: int, current_schedule: Schedule) -> Dict:
-        """
-        Calculate optimistic upper bound for remaining sessions.
-        Assumes we can schedule all remaining sessions without conflicts (optimistic).
-
-        Returns:
-            Dict with 'must_attend' and 'total' upper bounds
-        """
-        current_counts = current_schedule.count_by_priority(self.session_priorities)
-
-        # Count remaining sessions by priority
-        remaining_must = sum(1 for i in range(start_index, len(sessions))
-                            if self.session_priorities.get(sessions[i].id) == Priority.MUST_ATTEND)
-        remaining_total = len(sessions) - start_index
-
-        return {
-            'must_attend': current_counts[Priority.MUST_ATTEND] + remaining_must,
-            'total': len(current_schedule.entries) + remaining_total
-        }
-
-    def _can_improve_best(self, upper_bound: Dict) -> bool:
-        """Check if upper bound can possibly improve best schedule"""
-        if self.best_schedule is None or len(self.best_schedule.entries) == 0:
-            return True
-
-        best_counts = self.best_schedule.count_by_priority(self.session_priorities)
-
-        # Can we get more must-attend sessions?
-        if upper_bound['must_attend'] > best_counts[Priority.MUST_ATTEND]:
-            return True
-
-        # If same must-attend, can we get more total sessions?
-        if upper_bound['must_attend'] == best_counts[Priority.MUST_ATTEND]:
-            return upper_bound['total'] > len(self.best_schedule.entries)
-
-        return False
-
-    def _is_better_schedule(self, schedule1: Schedule, schedule2: Schedule) -> bool:
-        """Compare two schedules to determine which is better"""
-        if schedule2 is None or len(schedule2.entries) == 0:
-            return len(schedule1.entries) > 0
-
-        counts1 = schedule1.count_by_priority(self.session_priorities)
-        counts2 = schedule2.count_by_priority(self.session_priorities)
+        candidates = self._candidates
+        is_must = self._is_must
+        later_slots = self._later_slots
+        remaining_must = self._remaining_must
+        conflict_masks = self.conflict_index.conflict_masks
+        session_count = len(candidates)
+        best_ids = self._best_ids
+        best_must = self._best_must
+        nodes_explored = 0
+        branches_pruned = 0
+
+        chosen = []
+        stack = [(0, 0, -1, 0, 0)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            index, depth, slot_id, blocked, must_count = pop()
+            # Backtrack: drop choices made below this frame's parent
+            del chosen[depth:]
+            if slot_id >= 0:
+                chosen.append(slot_id)
+            elif best_ids and (must_count + remaining_must[index],
+                               depth + session_count - index) <= (best_must, len(best_ids)):
+                # Skipping the previous session already sinks the bound below
+                # the best schedule found so far (e.g. a lost must-attend)
+                branches_pruned += 1
+                continue
+            nodes_explored += 1
+
+            # Base case: processed all sessions
+            depth = len(chosen)
+            if index >= session_count:
+                # Priority: more must-attend sessions, then more total sessions
+                if (must_count, depth) > (best_must, len(best_ids)):
+                    best_ids = list(chosen)
+                    best_must = must_count
+                continue
 
-        # First priority: must-attend sessions
-        if counts1[Priority.MUST_ATTEND] != counts2[Priority.MUST_ATTEND]:
-            return counts1[Priority.MUST_ATTEND] > counts2[Priority.MUST_ATTEND]
+            # Pruning: check if this branch can possibly improve best solution
+            if best_ids and (must_count + remaining_must[index],
+                             depth + session_count - index) <= (best_must, len(best_ids)):
+                branches_pruned += 1
+                continue
 
-        # Second priority: total sessions
-        return len(schedule1.entries) > len(schedule2.entries)
+            # Collect the slots that fit; a slot that conflicts with none of the
+            # remaining sessions' slots dominates every other choice
+            remaining = later_slots[index + 1]
+            feasible = []
+            dominant = False
+            for candidate in candidates[index]:
+                if not blocked >> candidate & 1:
+                    mask = conflict_masks[candidate]
+                    if not mask & remaining:
+                        feasible = [candidate]
+                        dominant = True
+                        break
+                    feasible.append(candidate)
+
+            # Push children in reverse so they are visited in order: each slot
+            # first, then NOT scheduling this session
+            if not dominant:
+                push((index + 1, depth, -1, blocked, must_count))
+            next_must = must_count + is_must[index]
+            for candidate in reversed(feasible):
+                push((index + 1, depth, candidate, blocked | conflict_masks[candidate], next_must))
+
+        self._best_ids = best_ids
+        self._best_must = best_must
+        self.nodes_explored += nodes_explored
+        self.branches_pruned += branches_pruned
 
     def get_statistics(self, schedule: Schedule) -> Dict:
         """Get statistics about the schedule"""
@@ -573,21 +880,25 @@ class ILPScheduler:
     - Variables: binary variables for each session-timeslot pair
     - Constraints: no conflicts, each session scheduled at most once
     - Objective: maximize must-attend sessions first, then total sessions
+    - Warm start: greedy schedule seeds the solver and bounds the objective
 
     Time Complexity: Depends on solver (typically polynomial for practical problems)
     Space Complexity: O(n * m) for variables
     """
 
-    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int]):
+    def __init__(self, session_requests: List[SessionRequest], travel_times: Dict[tuple, int],
+                 conflict_index: Optional[ConflictIndex] = None):
         """
         Initialize ILP scheduler.
 
         Args:
             session_requests: List of session requests (session + priority)
             travel_times: Dict mapping (location_id1, location_id2) -> minutes
+            conflict_index: Prebuilt ConflictIndex for the same sessions and
+                travel times (e.g. shared between schedulers); built if omitted
         """
         self.session_requests = session_requests
-        self.travel_times = travel_times
+        self.travel_times = _canonical_travel_times(travel_times)
 
         # Create priority mapping
         self.session_priorities = {req.session.id: req.priority for req in session_requests}
@@ -599,6 +910,11 @@ class ILPScheduler:
         # All sessions for iteration
         self.sessions = [req.session for req in session_requests]
 
+        # Pairwise slot conflicts, computed once and reused for the constraints
+        if conflict_index is None:
+            conflict_index = ConflictIndex.build(self.sessions, self.travel_times)
+        self.conflict_index = conflict_index
+
         try:
             import pulp
             self.pulp = pulp
@@ -621,21 +937,45 @@ class ILPScheduler:
 
         # Create binary variables for each (session, timeslot) pair
         # x[session.id, slot_index] = 1 if session scheduled at that slot, 0 otherwise
+        # slot_keys[g] and flat_vars[g] map a ConflictIndex slot id back to its
+        # variable key and variable; they are filled by slot id, so the index
+        # may number the sessions in any order
         x = {}
+        slot_count = len(self.conflict_index.slots)
+        slot_keys = [None] * slot_count
+        flat_vars = [None] * slot_count
         for session in self.sessions:
-            for slot_idx, time_slot in enumerate(session.time_slots):
+            for slot_idx, g in enumerate(self.conflict_index.slot_ids[session.id]):
                 var_name = f"x_{session.id}_{slot_idx}"
                 x[(session.id, slot_idx)] = self.pulp.LpVariable(var_name, cat='Binary')
+                slot_keys[g] = (session.id, slot_idx)
+                flat_vars[g] = x[(session.id, slot_idx)]
 
         # Objective: Maximize must-attend sessions (weight 1000) + optional sessions (weight 1)
         # This ensures must-attend is prioritized
+        weights = {
+            session.id: 1000 if self.session_priorities.get(session.id) == Priority.MUST_ATTEND else 1
+            for session in self.sessions
+        }
         objective = self.pulp.lpSum([
-            x[(session.id, slot_idx)] * (1000 if self.session_priorities.get(session.id) == Priority.MUST_ATTEND else 1)
+            x[(session.id, slot_idx)] * weights[session.id]
             for session in self.sessions
             for slot_idx in range(len(session.time_slots))
         ])
         prob += objective
 
+        # Warm start: seed the solver with the greedy schedule as an incumbent
+        # and cut off every solution worse than it
+        greedy_schedule = SessionScheduler(self.session_requests, self.travel_times, self.conflict_index).optimize_schedule()
+        for var in x.values():
+            var.setInitialValue(0)
+        greedy_value = 0
+        for entry in greedy_schedule.entries:
+            slot_idx = entry.session.time_slots.index(entry.time_slot)
+            x[(entry.session.id, slot_idx)].setInitialValue(1)
+            greedy_value += weights[entry.session.id]
+        prob += objective >= greedy_value, "greedy_lower_bound"
+
         # Constraint 1: Each session scheduled at most once
         for session in self.sessions:
             prob += (
@@ -644,43 +984,24 @@ class ILPScheduler:
             )
 
         # Constraint 2: No time conflicts between scheduled sessions
-        for i, session1 in enumerate(self.sessions):
-            for slot1_idx, time_slot1 in enumerate(session1.time_slots):
-                for j, session2 in enumerate(self.sessions):
-                    if i >= j:  # Only check each pair once
-                        continue
-                    for slot2_idx, time_slot2 in enumerate(session2.time_slots):
-                        # Check if these slots conflict
-                        travel_time = self._get_travel_time(
-                            time_slot1.location, time_slot2.location
-                        )
-                        if time_slot1.conflicts_with(time_slot2, travel_time):
-                            # Can't schedule both
-                            prob += (
-                                x[(session1.id, slot1_idx)] + x[(session2.id, slot2_idx)] <= 1,
-                                f"conflict_{session1.id}_{slot1_idx}_{session2.id}_{slot2_idx}"
-                            )
+        # Only emit neighbours above g so every conflicting pair is added once
+        for g, conflicting in enumerate(self.conflict_index.conflict_lists):
+            key1 = slot_keys[g]
+            for h in conflicting[bisect_right(conflicting, g):]:
+                key2 = slot_keys[h]
+                # Can't schedule both
+                prob += (
+                    x[key1] + x[key2] <= 1,
+                    f"conflict_{key1[0]}_{key1[1]}_{key2[0]}_{key2[1]}"
+                )
 
         # Solve the problem
-        prob.solve(self.pulp.PULP_CBC_CMD(msg=0))  # msg=0 suppresses solver output
-
-        # Extract solution
-        schedule = Schedule()
-        for session in self.sessions:
-            for slot_idx, time_slot in enumerate(session.time_slots):
-                if x[(session.id, slot_idx)].varValue == 1:
-                    schedule.add_entry(session, time_slot)
-                    break
-
-        return schedule
+        prob.solve(self.pulp.PULP_CBC_CMD(msg=0, warmStart=True))  # msg=0 suppresses solver output
 
-    def _get_travel_time(self, loc1: Location, loc2: Location) -> int:
-        """Get travel time between two locations"""
-        if loc1 == loc2:
-            return 0
-        key = (loc1.id, loc2.id)
-        reverse_key = (loc2.id, loc1.id)
-        return self.travel_times.get(key, self.travel_times.get(reverse_key, 0))
+        # Extract solution in one pass over the flat variable list. CBC can
+        # report binaries as 0.9999..., so threshold instead of comparing to 1
+        chosen = [g for g, var in enumerate(flat_vars) if (var.varValue or 0) > 0.5]
+        return self.conflict_index.to_schedule(chosen)
 
     def get_statistics(self, schedule: Schedule) -> Dict:
         """Get statistics about the schedule"""